@@ -2,6 +2,7 @@ use std::path::PathBuf;
 
 use pyo3::exceptions::PyTypeError;
 use pyo3::prelude::*;
+use pyo3::types::PyString;
 
 use berlin_core::location::Location;
 use berlin_core::locations_db::{parse_data_files, LocationsDb};
@@ -17,20 +18,16 @@ struct LocationProxy {
     _loc: Location,
 }
 
-#[pymethods]
 impl LocationsDbProxy {
-    fn query(
+    fn search(
         &self,
         query: String,
         state: Option<String>,
         limit: usize,
         lev_distance: u32,
-    ) -> PyResult<Vec<LocationProxy>> {
-        let gil = Python::acquire_gil();
-        let _py = gil.python();
+    ) -> Vec<LocationProxy> {
         let st = SearchTerm::from_raw_query(query, state, limit, lev_distance);
-        let results = self
-            ._db
+        self._db
             .search(&st)
             .into_iter()
             .map(|(key, _score)| {
@@ -42,41 +39,83 @@ impl LocationsDbProxy {
                     .expect("loc should be in db");
                 LocationProxy { _loc: loc }
             })
-            .collect();
+            .collect()
+    }
+}
+
+#[pymethods]
+impl LocationsDbProxy {
+    fn query(
+        &self,
+        py: Python,
+        query: String,
+        state: Option<String>,
+        limit: usize,
+        lev_distance: u32,
+    ) -> PyResult<Vec<LocationProxy>> {
+        let results = py.allow_threads(|| self.search(query, state, limit, lev_distance));
+        Ok(results)
+    }
+
+    fn query_many(
+        &self,
+        py: Python,
+        queries: &PyAny,
+        state: Option<String>,
+        limit: usize,
+        lev_distance: u32,
+    ) -> PyResult<Vec<Vec<LocationProxy>>> {
+        if queries.is_instance::<PyString>()? {
+            let err = PyTypeError::new_err("queries must be a list of strings, not a string");
+            return Err(err);
+        }
+        let queries: Vec<String> = queries.extract()?;
+        let results: Vec<Vec<LocationProxy>> = py.allow_threads(|| {
+            queries
+                .into_iter()
+                .map(|query| self.search(query, state.clone(), limit, lev_distance))
+                .collect()
+        });
         Ok(results)
     }
 }
 
 #[pymethods]
 impl LocationProxy {
-    fn __getattr__(&self, attr: String) -> PyResult<PyObject> {
-        let gil = Python::acquire_gil();
-        let py = gil.python();
-        let val = match attr.as_str() {
-            "key" => self._loc.key.to_string(),
-            "encoding" => self._loc.encoding.to_string(),
-            "id" => self._loc.id.to_string(),
-            "words" => self
-                ._loc
-                .words
-                .iter()
-                .map(|word| word.to_string())
-                .collect::<Vec<_>>()
-                .join(" "),
-            _ => {
-                let err = PyTypeError::new_err("AttributeError");
-                return Err(err);
+    #[getter]
+    fn key(&self) -> String {
+        self._loc.key.to_string()
+    }
+
+    #[getter]
+    fn encoding(&self) -> String {
+        self._loc.encoding.to_string()
+    }
+
+    #[getter]
+    fn id(&self) -> String {
+        self._loc.id.to_string()
+    }
+
+    #[getter]
+    fn words(&self) -> String {
+        let len = self._loc.words.iter().map(|word| word.len() + 1).sum();
+        let mut words = String::with_capacity(len);
+        for (i, word) in self._loc.words.iter().enumerate() {
+            if i > 0 {
+                words.push(' ');
             }
-        };
-        Ok(val.to_object(py))
+            words.push_str(word);
+        }
+        words
     }
 }
 
 /// Formats the sum of two numbers as string.
 #[pyfunction]
-fn load(data_dir: String) -> PyResult<LocationsDbProxy> {
+fn load(py: Python, data_dir: String) -> PyResult<LocationsDbProxy> {
     let data_path = PathBuf::from(data_dir);
-    let db = parse_data_files(data_path);
+    let db = py.allow_threads(|| parse_data_files(data_path));
     let db_proxy = LocationsDbProxy { _db: db };
     Ok(db_proxy)
 }